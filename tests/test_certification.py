@@ -17,10 +17,14 @@ Requirements:
 """
 
 import argparse
+import hashlib
+import heapq
 import json
 import re
 import sys
+from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from llm_api_server.eval import (
@@ -31,11 +35,26 @@ from llm_api_server.eval import (
     TestResult,
 )
 
+# orjson parses large question banks ~2-5x faster than stdlib json; fall back
+# to stdlib when it isn't installed (it's an optional dev dependency)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyahocorasick finds every expected answer in one linear pass over the
+# response; the validators fall back to per-line scanning without it
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configuration
 IVAN_API_URL = "http://localhost:8000"
 DEFAULT_MODEL = "wwtfo/ivan"
 QUESTIONS_FILE = Path(__file__).parent / "certification_questions.json"
 REQUEST_TIMEOUT = 300  # 5 minutes - generous timeout for slow models/tool loops
+CACHE_DIR = Path(__file__).parent / ".ivan_cache"
 
 # ANSI color codes for terminal output
 GREEN = "\033[92m"
@@ -44,11 +63,18 @@ RESET = "\033[0m"
 CHECK_MARK = f"{GREEN}✓{RESET}"
 X_MARK = f"{RED}✗{RESET}"
 
+# Option letters for multiple-choice questions (indexed by option position)
+_LETTERS = "ABCDEFGHIJ"
+
 
 # =============================================================================
 # Text Normalization
 # =============================================================================
 
+# Compiled once at import - normalize_text runs hundreds of times per suite
+# and re.sub with a literal pattern pays a cache lookup on every call
+_WS_RE = re.compile(r"\s+")
+
 
 def normalize_text(text: str) -> str:
     """
@@ -101,7 +127,7 @@ def normalize_text(text: str) -> str:
         normalized = normalized.replace(char, " ")
 
     # Replace multiple spaces with single space
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WS_RE.sub(" ", normalized)
 
     return normalized.strip()
 
@@ -110,6 +136,38 @@ def normalize_text(text: str) -> str:
 # Custom Validators for Each Question Type
 # =============================================================================
 
+# Validator patterns, compiled once at import. These all match against
+# already-lowercased text, so no IGNORECASE flag is needed (case-folding on
+# every character compare would be wasted work).
+#
+# The three markdown answer shapes ("**Answer:** True", "⬜ **True**",
+# standalone "**true**") are folded into one alternation so the engine makes
+# a single sweep over the response instead of three.
+_TF_COMBINED = re.compile(
+    r"\*\*answer:?\*\*:?\s*(?:⬜\s*)?(?P<answer>\w+)"
+    r"|⬜\s*\*\*(?P<bold_box>\w+)\*\*"
+    r"|\*\*(?P<standalone>true|false)\*\*"
+)
+
+# Strips checkbox/checkmark symbols in one pass instead of a chain of four
+# str.replace calls (each of which allocates a new string)
+_SYMBOL_STRIP = str.maketrans("", "", "☑✓✔⬜")
+
+# One-pass presence gate: `not _CHECKMARKS.isdisjoint(s)` scans s once
+# instead of three separate `in` scans (one per checkmark variant)
+_CHECKMARKS = frozenset("☑✓✔")
+
+# Accepted first words for True/False answers, including en-dash/em-dash
+# variants (unicode escapes for the linter) and markdown bold. Frozensets
+# give hashed O(1) membership instead of a list literal built per call.
+_TRUE_FIRST = frozenset({"true", "true.", "true,", "true\u2013", "true\u2014", "**true**"})
+_FALSE_FIRST = frozenset({"false", "false.", "false,", "false\u2013", "false\u2014", "**false**"})
+
+# "Checked answer" literals for True/False questions, prebuilt so the
+# validator doesn't rebuild the f-strings on every call
+_CHECKED_TRUE = ("☑ true", "✓ true", "✔ true")
+_CHECKED_FALSE = ("☑ false", "✓ false", "✔ false")
+
 
 def create_true_false_validator(correct_answer: str) -> Callable[[str], tuple[bool, list[str]]]:
     """Create a validator for True/False questions."""
@@ -121,49 +179,54 @@ def create_true_false_validator(correct_answer: str) -> Callable[[str], tuple[bo
         response_lower = response.lower()
         correct_lower = correct_answer.lower()
 
-        # Look for checkmark/selection indicators
-        if "☑" in response or "✓" in response or "✔" in response:
-            if correct_lower == "true":
-                if any(f"{mark} true" in response_lower for mark in ["☑", "✓", "✔"]):
-                    return True, []
-            else:
-                if any(f"{mark} false" in response_lower for mark in ["☑", "✓", "✔"]):
-                    return True, []
+        # Cheapest discriminator first: the prompt asks for a bare
+        # True/False answer, so most responses resolve on the first word
+        # before any checkmark or regex scanning. lstrip before splitting so
+        # a leading newline (common LLM output) doesn't hide the answer on
+        # what is technically the second line.
+        stripped = response_lower.lstrip()
+        first_word = stripped.split(None, 1)[0] if stripped else ""
 
-        # Look for "**Answer:**" pattern (markdown bold) - common LLM response format
-        # Matches: "**Answer:** ⬜ True", "**Answer:** True", "**answer**: false"
-        answer_pattern = re.search(r"\*\*answer:?\*\*:?\s*(?:⬜\s*)?(\w+)", response_lower)
-        if answer_pattern:
-            answer_word = answer_pattern.group(1)
-            if answer_word == correct_lower:
+        if correct_lower == "true":
+            if first_word in _TRUE_FIRST:
                 return True, []
+        elif first_word in _FALSE_FIRST:
+            return True, []
 
-        # Look for explicit answer in first line
-        first_line = response_lower.split("\n")[0] if "\n" in response_lower else response_lower
-        first_word = first_line.strip().split()[0] if first_line.strip() else ""
-
-        # Look for "⬜ **True**" or "⬜ **False**" pattern (bold markdown answer)
-        bold_answer_pattern = re.search(r"⬜\s*\*\*(\w+)\*\*", response_lower)
-        if bold_answer_pattern:
-            bold_answer = bold_answer_pattern.group(1)
-            if bold_answer == correct_lower:
+        # Look for checkmark/selection indicators. The any() over three
+        # prebuilt literals already short-circuits, so no separate
+        # "checkmark present?" pre-scan is needed.
+        if correct_lower == "true":
+            if any(mark in response_lower for mark in _CHECKED_TRUE):
                 return True, []
+        elif any(mark in response_lower for mark in _CHECKED_FALSE):
+            return True, []
 
-        # Look for standalone "**True**" or "**False**" (bold markdown without checkbox)
-        standalone_bold_pattern = re.search(r"\*\*(true|false)\*\*", response_lower)
-        if standalone_bold_pattern:
-            bold_answer = standalone_bold_pattern.group(1)
-            if bold_answer == correct_lower:
+        # Look for markdown answer patterns in one pass - matches
+        # "**Answer:** ⬜ True", "**Answer:** True", "⬜ **True**", "**true**".
+        # Only the first occurrence of each shape counts, mirroring the
+        # original one-search-per-pattern behavior: a response whose first
+        # "**Answer:**" is wrong must not pass because the right word shows
+        # up in a later one.
+        seen_groups: set[str | None] = set()
+        for match in _TF_COMBINED.finditer(response_lower):
+            group = match.lastgroup
+            if group in seen_groups:
+                continue
+            seen_groups.add(group)
+            if match.group(group) == correct_lower:
                 return True, []
+            if len(seen_groups) == 3:
+                break
 
+        # The format prompt asks for the answer up front, so phrase scans only
+        # need the head of the response - no point scanning a long rationale
+        head = response_lower[:512]
         if correct_lower == "true":
-            # Check for explicit "true" as first word (including en-dash/em-dash variants and markdown bold)
-            if first_word in ["true", "true.", "true,", "true\u2013", "true\u2014", "**true**"]:
-                return True, []
             # Check for affirmative statements
             affirmative_phrases = ["answer is true", "answer: true", "is true", "true."]
             negative_phrases = ["not true", "is false", "answer is false"]
-            if any(phrase in response_lower for phrase in affirmative_phrases) and not any(
+            if any(phrase in head for phrase in affirmative_phrases) and not any(
                 phrase in response_lower[:100] for phrase in negative_phrases
             ):
                 return True, []
@@ -171,11 +234,8 @@ def create_true_false_validator(correct_answer: str) -> Callable[[str], tuple[bo
             if "⬜ true" in response_lower and "⬜ false" not in response_lower:
                 return True, []
         else:
-            # Check for explicit "false" as first word (including en-dash/em-dash variants and markdown bold)
-            if first_word in ["false", "false.", "false,", "false\u2013", "false\u2014", "**false**"]:
-                return True, []
             # Check for negative statements
-            if any(phrase in response_lower for phrase in ["answer is false", "answer: false", "is false", "false."]):
+            if any(phrase in head for phrase in ["answer is false", "answer: false", "is false", "false."]):
                 return True, []
             # Check for "⬜ false" pattern (unchecked box used as label for chosen answer)
             if "⬜ false" in response_lower and "⬜ true" not in response_lower:
@@ -188,68 +248,77 @@ def create_true_false_validator(correct_answer: str) -> Callable[[str], tuple[bo
 
 def create_multiple_choice_validator(correct_answer: str, correct_letter: str | None = None) -> Callable[[str], tuple[bool, list[str]]]:
     """Create a validator for Multiple Choice questions."""
+    # The correct answer is fixed at factory time, so normalize it (and build
+    # the letter patterns) once here instead of on every validator call
+    correct_normalized = normalize_text(correct_answer.lower())
+    correct_words = frozenset(correct_normalized.split())
+    letter_lower = correct_letter.lower() if correct_letter else None
+    letter_patterns = (
+        (
+            f"answer is {letter_lower}",
+            f"answer: {letter_lower}",
+            f"answer is **{letter_lower}**",
+            f"**{letter_lower}**",
+        )
+        if letter_lower
+        else ()
+    )
 
     def validator(response: str) -> tuple[bool, list[str]]:
         if not response:
             return False, ["No response received"]
 
         response_lower = response.lower()
-        correct_lower = correct_answer.lower()
 
-        # Check for letter answer (A, B, C, D) if we know the correct letter
-        if correct_letter:
-            # Look for standalone letter at start of response
-            first_word = response_lower.strip().split()[0] if response_lower.strip() else ""
-            if first_word.rstrip(".),:") == correct_letter.lower():
-                return True, []
-            # Look for "answer is D" or "answer: D" patterns
-            letter_patterns = [
-                f"answer is {correct_letter.lower()}",
-                f"answer: {correct_letter.lower()}",
-                f"answer is **{correct_letter.lower()}**",
-                f"**{correct_letter.lower()}**",
-            ]
-            if any(pattern in response_lower for pattern in letter_patterns):
+        # Cheapest discriminator first: a bare letter answer ("D", "d)")
+        # resolves on the first word with no normalization at all. lstrip
+        # before taking the first line so a leading newline doesn't leave an
+        # empty first line and sink a "\nC." style answer.
+        first_line = response_lower.lstrip().partition("\n")[0]
+        if letter_lower:
+            first_word = first_line.split(None, 1)[0] if first_line else ""
+            if first_word.rstrip(".),:") == letter_lower:
                 return True, []
 
+        # Well-behaved responses answer in the first line, so try that
+        # before any per-line or regex scanning
+        first_line_normalized = normalize_text(first_line)
+        if correct_normalized == first_line_normalized or correct_normalized in first_line_normalized:
+            return True, []
+
+        # Full-response normalized containment (single substring scan)
+        response_normalized = normalize_text(response_lower)
+        if correct_normalized == response_normalized or correct_normalized in response_normalized:
+            return True, []
+
+        # Check for "answer is D" / "answer: D" patterns if we know the letter
+        if letter_patterns and any(pattern in response_lower for pattern in letter_patterns):
+            return True, []
+
         # Look for checkmark next to correct answer
-        if "☑" in response or "✓" in response or "✔" in response:
-            lines = response_lower.split("\n")
-            for line in lines:
-                if "☑" in line or "✓" in line or "✔" in line:
-                    line_clean = line.replace("☑", "").replace("✓", "").replace("✔", "").replace("⬜", "")
+        if not _CHECKMARKS.isdisjoint(response):
+            for line in response_lower.splitlines():
+                if not _CHECKMARKS.isdisjoint(line):
+                    line_clean = line.translate(_SYMBOL_STRIP)
                     line_normalized = normalize_text(line_clean)
-                    correct_normalized = normalize_text(correct_lower)
-
                     if line_normalized == correct_normalized or correct_normalized in line_normalized:
                         return True, []
 
-        # Look for explicit answer statement
-        if "answer:" in response_lower or "answer is" in response_lower or "correct answer" in response_lower:
+        # Look for explicit answer statement. The format prompt puts the
+        # answer first, so gate the scans on the head of the response.
+        head = response_lower[:512]
+        if "answer:" in head or "answer is" in head or "correct answer" in head:
             for phrase in ["answer:", "answer is", "correct answer is", "correct answer:"]:
-                if phrase in response_lower:
-                    answer_part = response_lower.split(phrase)[1].split("\n")[0]
+                if phrase in head:
+                    # partition scans once and allocates no list, unlike
+                    # split(phrase)[1].split("\n")[0]
+                    answer_part = response_lower.partition(phrase)[2].partition("\n")[0]
                     answer_normalized = normalize_text(answer_part)
-                    correct_normalized = normalize_text(correct_lower)
                     if correct_normalized in answer_normalized:
                         return True, []
 
-        # Check normalized text containment
-        correct_normalized = normalize_text(correct_lower)
-        response_normalized = normalize_text(response_lower)
-
-        if correct_normalized == response_normalized or correct_normalized in response_normalized:
-            return True, []
-
-        # Check first line specifically
-        first_line = response_lower.split("\n")[0] if "\n" in response_lower else response_lower
-        first_line_normalized = normalize_text(first_line)
-        if correct_normalized == first_line_normalized or correct_normalized in first_line_normalized:
-            return True, []
-
-        # Fuzzy match for longer answers
+        # Fuzzy match for longer answers - last resort, needs set construction
         if len(correct_normalized) > 10:
-            correct_words = set(correct_normalized.split())
             response_words = set(response_normalized.split())
             if correct_words and len(correct_words & response_words) >= len(correct_words) * 0.9:
                 return True, []
@@ -261,63 +330,111 @@ def create_multiple_choice_validator(correct_answer: str, correct_letter: str |
 
 def create_multiple_answer_validator(correct_answers: list[str]) -> Callable[[str], tuple[bool, list[str]]]:
     """Create a validator for Multiple Answer questions."""
+    # Normalize every expected answer once at factory time; the per-line
+    # loops below then only compare against these precomputed forms
+    precomputed = []
+    for correct in correct_answers:
+        correct_normalized = normalize_text(correct.lower())
+        precomputed.append((correct, correct_normalized, frozenset(correct_normalized.split())))
+
+    # Inverted index (word -> answer ids) for the fuzzy branch: each line's
+    # words are tallied against every answer in one pass instead of
+    # intersecting word sets per (line, answer) pair
+    word_to_ids: dict[str, list[int]] = defaultdict(list)
+    for idx, (_, _, words_in_correct) in enumerate(precomputed):
+        for word in words_in_correct:
+            word_to_ids[word].append(idx)
+    word_to_ids = dict(word_to_ids)
+
+    # Multi-pattern automaton built once per question: a single scan of the
+    # normalized response matches all expected answers simultaneously
+    automaton = None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for correct, correct_normalized, _ in precomputed:
+            automaton.add_word(correct_normalized, correct)
+        automaton.make_automaton()
 
     def validator(response: str) -> tuple[bool, list[str]]:
         if not response:
             return False, ["No response received"]
 
         response_lower = response.lower()
-        found_correct = set()
+
+        # Track the answers still unaccounted for; every match path discards
+        # from this one set, so "all found" is just emptiness and no
+        # set(correct_answers) - found_correct rebuild is needed
+        remaining = {correct for correct, _, _ in precomputed}
+
+        # Fast path: one Aho-Corasick sweep over the normalized response
+        # instead of re-scanning it once per expected answer. The line-based
+        # fallback below still runs for anything the sweep didn't find
+        # (e.g. fuzzy word-overlap matches). Skipped entirely when the
+        # response contains checkmarks: those mark which options were
+        # *selected*, and a response that checks the wrong boxes still echoes
+        # every option somewhere, which the sweep would wrongly accept. The
+        # checkmark branch below stays authoritative in that case.
+        if automaton is not None and _CHECKMARKS.isdisjoint(response):
+            for _end, correct in automaton.iter(normalize_text(response_lower)):
+                remaining.discard(correct)
+            if not remaining:
+                return True, []
+
+        # Split the lowered response once; both scanning passes below reuse
+        # it (splitlines also handles \r\n without leaving stray \r)
+        lines_lower = response_lower.splitlines()
 
         # Look for checkmark indicators
-        if "☑" in response or "✓" in response or "✔" in response:
-            lines = response_lower.split("\n")
-            for line in lines:
-                if "☑" in line or "✓" in line or "✔" in line:
-                    line_clean = line.replace("☑", "").replace("✓", "").replace("✔", "").replace("⬜", "")
+        if not _CHECKMARKS.isdisjoint(response):
+            checkmark_matched = False
+            for line in lines_lower:
+                if not _CHECKMARKS.isdisjoint(line):
+                    line_clean = line.translate(_SYMBOL_STRIP)
                     line_normalized = normalize_text(line_clean)
-                    for correct in correct_answers:
-                        correct_normalized = normalize_text(correct.lower())
+                    for correct, correct_normalized, _ in precomputed:
                         if correct_normalized in line_normalized or line_normalized in correct_normalized:
-                            found_correct.add(correct)
+                            remaining.discard(correct)
+                            checkmark_matched = True
 
-            if found_correct:
-                if len(found_correct) == len(correct_answers):
+            if checkmark_matched:
+                if not remaining:
                     return True, []
-                missing = set(correct_answers) - found_correct
-                return False, [f"Missing answers: {', '.join(missing)}"]
+                return False, [f"Missing answers: {', '.join(remaining)}"]
 
-        # Look for listed items
-        lines = response.split("\n")
-        for line in lines:
+        # Look for listed items (already lowercased - normalize_text lowers
+        # again, so no separate .lower() per line is needed)
+        for line in lines_lower:
             line_clean = line.strip()
             if not line_clean or len(line_clean) > 200:
                 continue
 
             line_clean = line_clean.lstrip("⬜☑✓✔-•*123456789. ")
-            line_normalized = normalize_text(line_clean.lower())
-
-            for correct in correct_answers:
-                correct_normalized = normalize_text(correct.lower())
-
+            line_normalized = normalize_text(line_clean)
+
+            # Tally this line's words against all answers at once via the
+            # inverted index (words_in_line is a set, so each shared word
+            # counts once - same as the old set intersection)
+            overlap_counts: dict[int, int] = {}
+            for word in set(line_normalized.split()):
+                for answer_id in word_to_ids.get(word, ()):
+                    overlap_counts[answer_id] = overlap_counts.get(answer_id, 0) + 1
+
+            for answer_id, (correct, correct_normalized, words_in_correct) in enumerate(precomputed):
+                if correct not in remaining:
+                    continue
                 if correct_normalized in line_normalized or line_normalized in correct_normalized:
-                    found_correct.add(correct)
-                elif len(correct_normalized) > 20:
-                    words_in_correct = set(correct_normalized.split())
-                    words_in_line = set(line_normalized.split())
-                    if len(words_in_correct & words_in_line) >= len(words_in_correct) * 0.8:
-                        found_correct.add(correct)
-                elif len(correct_normalized) <= 20:
-                    words_in_correct = set(correct_normalized.split())
-                    words_in_line = set(line_normalized.split())
-                    if words_in_correct and len(words_in_correct & words_in_line) >= len(words_in_correct) * 0.9:
-                        found_correct.add(correct)
-
-        if len(found_correct) == len(correct_answers):
-            return True, []
+                    remaining.discard(correct)
+                    continue
+                if words_in_correct:
+                    threshold = 0.8 if len(correct_normalized) > 20 else 0.9
+                    if overlap_counts.get(answer_id, 0) >= len(words_in_correct) * threshold:
+                        remaining.discard(correct)
+
+            # Early exit as soon as every answer is accounted for
+            if not remaining:
+                return True, []
 
-        missing = set(correct_answers) - found_correct
-        return False, [f"Missing answers: {', '.join(missing)}"]
+        return False, [f"Missing answers: {', '.join(remaining)}"]
 
     return validator
 
@@ -341,22 +458,24 @@ def format_question(question_data: dict) -> str:
             "Answer with ONLY 'True' or 'False'. Do not include any explanation or other text."
         )
     elif question_type == "multiple_choice":
-        formatted = f"{question_text}\n\n"
-        for option in options:
-            formatted += f"⬜ {option}\n"
-        formatted += (
+        # Build parts and join once instead of += per option (quadratic
+        # copying when the interned-string fast path misses)
+        parts = [question_text, ""]
+        parts.extend(f"⬜ {option}" for option in options)
+        parts.append(
             "\nSelect exactly ONE answer. Respond with ONLY the answer text, nothing else. "
             "Do not include any explanation, reasoning, or additional text."
         )
+        formatted = "\n".join(parts)
     elif question_type == "multiple_answer":
         num_answers = len(question_data.get("correct_answers", []))
-        formatted = f"{question_text.replace('(Select 2)', '').strip()}\n\n"
-        for option in options:
-            formatted += f"⬜ {option}\n"
-        formatted += (
+        parts = [question_text.replace("(Select 2)", "").strip(), ""]
+        parts.extend(f"⬜ {option}" for option in options)
+        parts.append(
             f"\nSelect exactly {num_answers} answers. Respond with ONLY the {num_answers} answer texts, "
             "one per line. Do not include any explanation, reasoning, or additional text."
         )
+        formatted = "\n".join(parts)
     else:
         formatted = question_text
 
@@ -370,8 +489,11 @@ def format_question(question_data: dict) -> str:
 
 def load_test_cases(questions_file: Path) -> list[TestCase]:
     """Load questions from JSON and convert to TestCase objects."""
-    with open(questions_file) as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(questions_file.read_bytes())
+    else:
+        with open(questions_file) as f:
+            data = json.load(f)
 
     test_cases = []
 
@@ -384,22 +506,27 @@ def load_test_cases(questions_file: Path) -> list[TestCase]:
 
     for key, product_name in products:
         questions = data.get(key, [])
+        # Intern the values repeated across every test case so summary
+        # grouping compares by pointer identity instead of char-by-char
+        key = sys.intern(key)
+        product_name = sys.intern(product_name)
 
         for q in questions:
             question_id = q["id"]
-            question_type = q["type"]
+            question_type = sys.intern(q["type"])
 
             # Create the appropriate validator
             if question_type == "true_false":
                 validator = create_true_false_validator(q["correct_answer"])
                 correct_display = q["correct_answer"]
             elif question_type == "multiple_choice":
-                # Compute correct letter (A, B, C, D) from options
+                # Compute correct letter (A, B, C, D) from options in one pass
                 options = q.get("options", [])
                 correct_letter = None
-                if options and q["correct_answer"] in options:
-                    idx = options.index(q["correct_answer"])
-                    correct_letter = chr(ord("A") + idx)  # A, B, C, D...
+                for idx, option in enumerate(options):
+                    if option == q["correct_answer"]:
+                        correct_letter = _LETTERS[idx]
+                        break
                 validator = create_multiple_choice_validator(q["correct_answer"], correct_letter)
                 correct_display = q["correct_answer"]
             elif question_type == "multiple_answer":
@@ -433,6 +560,63 @@ def load_test_cases(questions_file: Path) -> list[TestCase]:
     return test_cases
 
 
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+
+def _cache_key(test_case: TestCase) -> str:
+    """Stable cache key for a test case, tolerant of whitespace/punctuation tweaks."""
+    return hashlib.sha256(normalize_text(test_case.question).encode()).hexdigest()
+
+
+def _load_cached_result(test_case: TestCase) -> TestResult | None:
+    """Return a TestResult built from a cached response, or None on cache miss.
+
+    The cached response is re-validated with the current validator, so grading
+    changes still take effect on cached runs.
+    """
+    cache_file = CACHE_DIR / f"{_cache_key(test_case)}.json"
+    if not cache_file.exists():
+        return None
+
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    response = cached.get("response", "")
+    if not response:
+        return None
+
+    passed, issues = test_case.custom_validator(response)
+    return TestResult(
+        test_case=test_case,
+        passed=passed,
+        response=response,
+        response_time=0.0,
+        issues=issues,
+    )
+
+
+def _store_cached_result(test_case: TestCase, result: TestResult) -> None:
+    """Persist a successful response for reuse on later runs."""
+    if not result.response:
+        return
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_file = CACHE_DIR / f"{_cache_key(test_case)}.json"
+    cache_file.write_text(
+        json.dumps(
+            {
+                "question_id": test_case.metadata.get("question_id"),
+                "response": result.response,
+                "response_time": result.response_time,
+            }
+        )
+    )
+
+
 # =============================================================================
 # Custom Console Reporter with Product Breakdown
 # =============================================================================
@@ -444,16 +628,35 @@ def print_detailed_summary(results: list[TestResult]):
     print("DETAILED SUMMARY")
     print("=" * 80)
 
-    # Overall stats
+    # Single pass over results: overall, per-product, and per-type buckets
+    # ([passed, total, time]) plus the failed list, instead of re-filtering
+    # the results list for every breakdown
     total = len(results)
-    passed = sum(1 for r in results if r.passed)
-    failed = total - passed
-    pass_rate = (passed / total * 100) if total > 0 else 0
+    passed = 0
+    total_time = 0.0
+    product_stats: dict[str, list] = defaultdict(lambda: [0, 0, 0.0])
+    type_stats: dict[str, list] = defaultdict(lambda: [0, 0, 0.0])
+    failed_tests = []
+
+    for r in results:
+        if r.passed:
+            passed += 1
+        else:
+            failed_tests.append(r)
+        total_time += r.response_time
+
+        product_bucket = product_stats[r.test_case.metadata.get("product", "Unknown")]
+        type_bucket = type_stats[r.test_case.metadata.get("question_type", "unknown")]
+        for bucket in (product_bucket, type_bucket):
+            if r.passed:
+                bucket[0] += 1
+            bucket[1] += 1
+            bucket[2] += r.response_time
 
+    pass_rate = (passed / total * 100) if total > 0 else 0
     print(f"\nOverall: {passed}/{total} tests passed ({pass_rate:.1f}%)")
 
     # Timing stats
-    total_time = sum(r.response_time for r in results)
     avg_time = total_time / total if total > 0 else 0
     print("\nTiming:")
     print(f"  Total time: {total_time:.2f}s ({total_time/60:.1f}m)")
@@ -461,28 +664,22 @@ def print_detailed_summary(results: list[TestResult]):
 
     # By product
     print("\nBy product:")
-    products = {r.test_case.metadata.get("product", "Unknown") for r in results}
-    for product in sorted(products):
-        prod_results = [r for r in results if r.test_case.metadata.get("product") == product]
-        prod_passed = sum(1 for r in prod_results if r.passed)
-        prod_total = len(prod_results)
+    for product in sorted(product_stats):
+        prod_passed, prod_total, prod_time = product_stats[product]
         prod_rate = (prod_passed / prod_total * 100) if prod_total > 0 else 0
-        prod_avg_time = sum(r.response_time for r in prod_results) / prod_total if prod_total > 0 else 0
+        prod_avg_time = prod_time / prod_total if prod_total > 0 else 0
         print(f"  {product:15s}: {prod_passed:2d}/{prod_total:2d} ({prod_rate:5.1f}%) - avg {prod_avg_time:.2f}s/test")
 
     # By question type
     print("\nBy question type:")
-    types = {r.test_case.metadata.get("question_type", "unknown") for r in results}
-    for qtype in sorted(types):
-        type_results = [r for r in results if r.test_case.metadata.get("question_type") == qtype]
-        type_passed = sum(1 for r in type_results if r.passed)
-        type_total = len(type_results)
+    for qtype in sorted(type_stats):
+        type_passed, type_total, type_time = type_stats[qtype]
         type_rate = (type_passed / type_total * 100) if type_total > 0 else 0
-        type_avg_time = sum(r.response_time for r in type_results) / type_total if type_total > 0 else 0
+        type_avg_time = type_time / type_total if type_total > 0 else 0
         print(f"  {qtype:20s}: {type_passed:2d}/{type_total:2d} ({type_rate:5.1f}%) - avg {type_avg_time:.2f}s/test")
 
-    # Slowest tests
-    slowest_tests = sorted(results, key=lambda r: r.response_time, reverse=True)[:5]
+    # Slowest tests (nlargest is O(n log 5) vs O(n log n) for a full sort)
+    slowest_tests = heapq.nlargest(5, results, key=lambda r: r.response_time)
     if slowest_tests:
         print("\nSlowest tests:")
         for r in slowest_tests:
@@ -491,7 +688,6 @@ def print_detailed_summary(results: list[TestResult]):
             print(f"  [{status}] {product} {r.test_case.metadata.get('question_id', '?')}: {r.response_time:.2f}s")
 
     # Failed tests
-    failed_tests = [r for r in results if not r.passed]
     if failed_tests:
         print(f"\nFailed tests ({len(failed_tests)}):")
         for r in failed_tests:
@@ -520,6 +716,8 @@ def main():
     parser.add_argument("--limit", "-n", type=int, help="Limit number of tests to run")
     parser.add_argument("--model", "-m", type=str, default=DEFAULT_MODEL, help=f"Model to test (default: {DEFAULT_MODEL})")
     parser.add_argument("--test", "-t", type=str, help="Run specific test(s). Format: 'terraform_associate_003' or 'terraform_associate_003:q15'")
+    parser.add_argument("--use-cache", action="store_true", help="Reuse cached responses from previous runs (re-validated)")
+    parser.add_argument("--concurrency", "-c", type=int, default=1, help="Number of tests to run in parallel (default: 1)")
     args = parser.parse_args()
 
     print("\n" + "=" * 80)
@@ -573,32 +771,69 @@ def main():
         test_cases = test_cases[: args.limit]
 
     # Run tests
-    print(f"\nRunning {len(test_cases)} tests...\n")
-    results = []
-
-    for i, test_case in enumerate(test_cases, 1):
+    concurrency = max(1, args.concurrency)
+    if concurrency > 1:
+        print(f"\nRunning {len(test_cases)} tests ({concurrency} in parallel)...\n")
+    else:
+        print(f"\nRunning {len(test_cases)} tests...\n")
+
+    def run_one(test_case):
+        """Run a single test case, using the response cache when enabled."""
+        result = _load_cached_result(test_case) if args.use_cache else None
+        from_cache = result is not None
+        if result is None:
+            result = evaluator.run_test(test_case)
+            if args.use_cache:
+                _store_cached_result(test_case, result)
+        return result, from_cache
+
+    def print_outcome(i, test_case, result, from_cache):
+        """Emit the per-test outcome block as one write.
+
+        Buffering the block and writing it atomically keeps concurrent runs
+        readable (blocks never interleave mid-test) and replaces half a dozen
+        print calls - each with its own lock/flush - with one.
+        """
         product = test_case.metadata.get("product", "?")
         qid = test_case.metadata.get("question_id", "?")
         qtype = test_case.metadata.get("question_type", "?")
         correct = test_case.metadata.get("correct_answer", "?")
 
-        print(f"[{i}/{len(test_cases)}] {product} {qid.upper()} ({qtype})")
-        print(f"  Expected: {correct[:60]}{'...' if len(correct) > 60 else ''}")
-
-        result = evaluator.run_test(test_case)
-        results.append(result)
+        out = [
+            f"[{i}/{len(test_cases)}] {product} {qid.upper()} ({qtype})",
+            f"  Expected: {correct[:60]}{'...' if len(correct) > 60 else ''}",
+        ]
 
         status = f"{CHECK_MARK} PASS" if result.passed else f"{X_MARK} FAIL"
-        print(f"  Result: {status} ({result.response_time:.2f}s)")
+        timing = "cached" if from_cache else f"{result.response_time:.2f}s"
+        out.append(f"  Result: {status} ({timing})")
 
         if not result.passed and result.issues:
-            for issue in result.issues:
-                print(f"  Issue: {issue}")
+            out.extend(f"  Issue: {issue}" for issue in result.issues)
 
         if args.verbose and result.response:
-            print(f"  Response preview: {result.response[:200]}...")
-
-        print()
+            out.append(f"  Response preview: {result.response[:200]}...")
+
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
+
+    if concurrency > 1:
+        # Run in a thread pool (run_test is I/O-bound waiting on the backend);
+        # results are collected by index so reports keep the original order
+        results = [None] * len(test_cases)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(run_one, tc): i for i, tc in enumerate(test_cases)}
+            for future in as_completed(futures):
+                i = futures[future]
+                result, from_cache = future.result()
+                results[i] = result
+                print_outcome(i + 1, test_cases[i], result, from_cache)
+    else:
+        results = []
+        for i, test_case in enumerate(test_cases, 1):
+            result, from_cache = run_one(test_case)
+            results.append(result)
+            print_outcome(i, test_case, result, from_cache)
 
     # Print detailed summary
     print_detailed_summary(results)
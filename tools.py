@@ -1,7 +1,15 @@
 """Tool definitions for Ivan - customer notes search and documentation search."""
 
+import heapq
+import inspect
 import logging
+import mmap
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +21,168 @@ from config import config
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Notes at or below this size are cached in memory across tool calls; larger
+# files fall back to the mmap scan so the cache can't balloon on outliers
+_NOTE_CACHE_MAX_BYTES = 256 * 1024
+
+
+# Single-entry cache of the Customer_Notes layout; the key embeds directory
+# mtimes so it self-invalidates when customers are added or renamed
+_DIR_CACHE: dict[tuple, list[tuple[Path, str]]] = {}
+
+
+def _customer_dirs(notes_path: Path) -> list[tuple[Path, str]]:
+    """Enumerate (customer_dir, lowercased name) pairs, cached per layout.
+
+    The on-disk layout rarely changes within a process lifetime, so repeat
+    tool calls reuse one walk. The cache key folds in the mtime of the root
+    and of each letter directory: adding, removing, or renaming a customer
+    touches its letter directory and misses the cache.
+    """
+    # scandir's DirEntry caches the stat from the directory listing, so
+    # is_dir()/stat() here don't issue an extra syscall per entry
+    # The documented layout is single-character [A-Z,0-9] buckets; anything
+    # else at this level (.git, .obsidian, .DS_Store, stray folders) is
+    # noise that would otherwise be scanned every cold walk
+    letter_dirs = []
+    with os.scandir(notes_path) as it:
+        for entry in it:
+            if len(entry.name) == 1 and entry.name.isalnum() and entry.is_dir():
+                letter_dirs.append((entry.name, entry.path, entry.stat().st_mtime_ns))
+
+    key = (
+        str(notes_path),
+        notes_path.stat().st_mtime_ns,
+        tuple(sorted((name, mtime) for name, _, mtime in letter_dirs)),
+    )
+    cached = _DIR_CACHE.get(key)
+    if cached is None:
+        cached = []
+        for _, letter_path, _ in letter_dirs:
+            with os.scandir(letter_path) as it:
+                for entry in it:
+                    if not entry.name.startswith(".") and entry.is_dir():
+                        cached.append((Path(entry.path), entry.name.lower()))
+        _DIR_CACHE.clear()  # only the current layout is ever live
+        _DIR_CACHE[key] = cached
+    return cached
+
+
+# Compiled once; only the fallback path for filenames that don't follow the
+# YYYY-MM-DD_Title.md convention ever runs it
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+def _extract_date(name: str) -> str:
+    """Pull a YYYY-MM-DD date out of a note filename, or return ''.
+
+    Nearly every note starts with the date, so a slice-and-isdigit check
+    answers the common case without the regex engine; anything else falls
+    back to searching the whole name.
+    """
+    head = name[:10]
+    if len(head) == 10 and head[4] == "-" and head[7] == "-" and (head[:4] + head[5:7] + head[8:]).isdigit():
+        return head
+    match = _DATE_RE.search(name)
+    return match.group(1) if match else ""
+
+
+# Per-customer cache of meeting-note listings: customer dir path -> (mtime
+# key, sorted file paths). Entries revalidate against directory mtimes, so
+# adding or removing a note only invalidates that customer.
+_MEETING_CACHE: dict[str, tuple[tuple, list[str]]] = {}
+
+
+def _meeting_files(customer_dir: Path) -> list[str]:
+    """List a customer's meeting-note paths, cached against directory mtimes.
+
+    Enumerating meetings directories and their markdown files costs several
+    directory reads per customer per search. The cache key folds in each
+    meetings directory's mtime, so a stale listing is impossible: touching
+    a note's directory misses the key and triggers a re-list.
+    """
+    meetings = []
+    with os.scandir(customer_dir) as it:
+        for entry in it:
+            if entry.is_dir() and "meeting" in entry.name.lower():
+                meetings.append((entry.path, entry.stat().st_mtime_ns))
+
+    key = tuple(meetings)
+    cached = _MEETING_CACHE.get(str(customer_dir))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    files = []
+    for meetings_path, _ in meetings:
+        with os.scandir(meetings_path) as it:
+            for entry in it:
+                # leading-dot skip drops editor lock/backup files like
+                # ".#note.md" that still carry the .md suffix
+                if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file():
+                    files.append(entry.path)
+    files.sort()
+    _MEETING_CACHE[str(customer_dir)] = (key, files)
+    return files
+
+
+# The notes root only changes when someone re-points the symlink or edits
+# .env, so its existence check is revalidated at most once a minute instead
+# of stat'ing on every tool call
+_NOTES_ROOT_TTL = 60.0
+_notes_root_state: tuple[float, str, Path, bool, str] | None = None
+
+
+def _notes_root() -> tuple[Path, bool, str]:
+    """Return (path, exists, absolute path string) for the notes root.
+
+    Cached for 60 seconds on a monotonic clock; the configured directory
+    name is part of the cached state so a config reload is picked up
+    immediately.
+    """
+    global _notes_root_state
+    state = _notes_root_state
+    now = time.monotonic()
+    if state is not None and now - state[0] < _NOTES_ROOT_TTL and state[1] == config.CUSTOMER_NOTES_DIR:
+        return state[2], state[3], state[4]
+
+    path = Path(config.CUSTOMER_NOTES_DIR)
+    exists = path.exists()
+    absolute = str(path.absolute())
+    _notes_root_state = (now, config.CUSTOMER_NOTES_DIR, path, exists, absolute)
+    return path, exists, absolute
+
+
+def _read_head(path: str, n: int) -> bytes:
+    """Read the first n bytes of a file through raw os calls.
+
+    open() builds a BufferedReader and file object per call; across the
+    thousands of small head reads a broad search performs, the raw
+    os.open/os.read/os.close sequence is measurably cheaper.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, n)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=4096)
+def _note_bytes(path_str: str, mtime_ns: int) -> bytes:
+    """Read a note's raw bytes, cached per (path, mtime).
+
+    Agents often call search_customer_notes several times in a row with
+    different content queries; embedding the mtime in the cache key means
+    repeat queries hit memory while edited files are re-read transparently.
+    """
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 1 << 20):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
 
 # =============================================================================
 # Customer Notes Tools
@@ -41,22 +211,23 @@ def search_customer_notes(
     Returns:
         A formatted string with matching notes, their paths, dates, and previews
     """
-    notes_path = Path(config.CUSTOMER_NOTES_DIR)
-
-    logger.info(f"[CUSTOMER_NOTES_SEARCH] Directory: {notes_path.absolute()}")
-    logger.info(f"[CUSTOMER_NOTES_SEARCH] Customer: {customer_name or 'ALL'}")
-    logger.info(f"[CUSTOMER_NOTES_SEARCH] Content query: {content_query or 'NONE'}")
-
-    # Normalize customer name: replace spaces with underscores
-    search_terms = []
+    notes_path, notes_exists, notes_abs = _notes_root()
+
+    # %-style args defer the string formatting to the handler, so a raised
+    # log level skips it entirely
+    logger.info("[CUSTOMER_NOTES_SEARCH] Directory: %s", notes_abs)
+    logger.info("[CUSTOMER_NOTES_SEARCH] Customer: %s", customer_name or "ALL")
+    logger.info("[CUSTOMER_NOTES_SEARCH] Content query: %s", content_query or "NONE")
+
+    # Normalize customer name: replace spaces with underscores. A set dedupes
+    # the two spellings automatically when the name contains no spaces, so
+    # each candidate is tested against at most the distinct terms.
+    search_terms: set[str] = set()
     if customer_name:
         customer_lower = customer_name.lower().strip()
-        normalized_name = customer_lower.replace(" ", "_")
-        search_terms.append(normalized_name)
-        if normalized_name != customer_lower:
-            search_terms.append(customer_lower)
+        search_terms = {customer_lower.replace(" ", "_"), customer_lower}
 
-    if not notes_path.exists():
+    if not notes_exists:
         return (
             f"Customer notes directory '{config.CUSTOMER_NOTES_DIR}' does not exist.\n\n"
             f"To set up customer notes:\n"
@@ -67,53 +238,139 @@ def search_customer_notes(
     limit = min(max(1, limit), 50)
     results: list[dict[str, Any]] = []
 
-    for letter_dir in notes_path.iterdir():
-        if not letter_dir.is_dir():
-            continue
-
-        for customer_dir in letter_dir.iterdir():
-            if not customer_dir.is_dir():
+    # Compile the content filter once; matching runs against mmap'd bytes so
+    # non-matching files are never decoded or lowercased into Python strings
+    content_pattern = re.compile(re.escape(content_query).encode("utf-8"), re.IGNORECASE) if content_query else None
+
+    def scan_note(item: tuple[str, str]) -> dict[str, Any] | None:
+        """Filter one note and build its result entry, or return None."""
+        customer, file_str = item
+        file_path = Path(file_str)
+        try:
+            if content_pattern is not None:
+                stat = file_path.stat()
+                if stat.st_size == 0:
+                    return None  # empty file can't match a non-empty query
+                if stat.st_size <= _NOTE_CACHE_MAX_BYTES:
+                    data = _note_bytes(file_str, stat.st_mtime_ns)
+                    if content_pattern.search(data) is None:
+                        return None
+                    head = data[:1024]
+                else:
+                    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if content_pattern.search(mm) is None:
+                            return None
+                        head = mm[:1024]
+            else:
+                # Only the preview is needed - read the head, not the file
+                head = _read_head(file_str, 1024)
+
+            date_str = _extract_date(file_path.name)
+
+            relative_path = file_path.relative_to(notes_path)
+            # maxsplit stops the scan after the lines the preview can use
+            preview_lines = head.decode("utf-8", errors="replace").split("\n", 5)[:5]
+            preview = "\n".join(line for line in preview_lines if line.strip())
+
+            return {
+                "customer": customer,
+                "file": str(relative_path),
+                "full_path": file_str,
+                "date": date_str,
+                "preview": preview[:200] + "..." if len(preview) > 200 else preview,
+            }
+
+        except OSError as e:
+            # One-line error, no traceback rendering: a directory with
+            # a few unreadable files shouldn't dominate scan time or
+            # log volume, and programming bugs still propagate
+            logger.error("[CUSTOMER_NOTES_SEARCH] Error reading %s: %s", file_path, e)
+            return None
+
+    # Apply the customer-name prefilter while collecting directories so
+    # rejected customers never spawn scan tasks; the layout walk itself is
+    # cached across calls
+    try:
+        candidates = _customer_dirs(notes_path)
+    except OSError:
+        # The cached existence check is up to 60s stale; if the directory
+        # vanished in that window, report it the same way as a fresh miss
+        return f"Customer notes directory '{config.CUSTOMER_NOTES_DIR}' does not exist."
+    customer_dirs: list[Path] = []
+    if search_terms:
+        # First-letter prune: a name match almost always starts at the first
+        # character, so most customers fail a one-character comparison
+        # before any substring scan runs
+        candidate_letters = {term[0] for term in search_terms if term}
+        for customer_dir, name_lower in candidates:
+            if candidate_letters and name_lower[:1] not in candidate_letters:
                 continue
+            if any(term in name_lower for term in search_terms):
+                customer_dirs.append(customer_dir)
+        if not customer_dirs:
+            # Substring matches can start mid-name; retry without the prune
+            # so those rare queries keep working
+            customer_dirs = [d for d, n in candidates if any(term in n for term in search_terms)]
+    else:
+        customer_dirs = [d for d, _ in candidates]
+
+    needs_sort = False
+
+    if sort_by_date and content_pattern is None:
+        # Every note is a hit when there's no content filter, so sorting the
+        # full candidate set just to keep `limit` entries is wasted work.
+        # Sort each customer's (cached) listing newest-first, lazily k-way
+        # merge them into global date order, and stop once the limit is
+        # filled - only the newest `limit` notes ever have their heads read.
+        def date_key(item: tuple[str, str]) -> str:
+            return _extract_date(os.path.basename(item[1]))
+
+        per_customer = [
+            sorted(
+                ((customer_dir.name, file_str) for file_str in _meeting_files(customer_dir)),
+                key=date_key,
+                reverse=True,
+            )
+            for customer_dir in customer_dirs
+        ]
+        for item in heapq.merge(*per_customer, key=date_key, reverse=True):
+            entry = scan_note(item)
+            if entry is not None:
+                results.append(entry)
+                if len(results) == limit:
+                    break
+    else:
+        # Flatten to per-file work items so even a single-customer search
+        # (the common case) spreads its stat + read calls across the pool
+        work_items = [
+            (customer_dir.name, file_str) for customer_dir in customer_dirs for file_str in _meeting_files(customer_dir)
+        ]
+
+        if not sort_by_date:
+            # Unsorted output keeps traversal order, so the first `limit`
+            # hits are the final answer - stop the moment they're collected
+            for item in work_items:
+                entry = scan_note(item)
+                if entry is not None:
+                    results.append(entry)
+                    if len(results) == limit:
+                        break
+        elif len(work_items) > 4:
+            needs_sort = True
+            with ThreadPoolExecutor(max_workers=min(16, len(work_items))) as pool:
+                # Collect in submission order so output stays deterministic
+                for entry in pool.map(scan_note, work_items):
+                    if entry is not None:
+                        results.append(entry)
+        else:
+            # A handful of files isn't worth the pool spin-up
+            needs_sort = True
+            for item in work_items:
+                entry = scan_note(item)
+                if entry is not None:
+                    results.append(entry)
 
-            if search_terms:
-                customer_dir_lower = customer_dir.name.lower()
-                if not any(term in customer_dir_lower for term in search_terms):
-                    continue
-
-            meetings_dirs = [d for d in customer_dir.iterdir() if d.is_dir() and "meeting" in d.name.lower()]
-
-            for meetings_dir in meetings_dirs:
-                for file_path in meetings_dir.glob("*.md"):
-                    try:
-                        content = file_path.read_text(encoding="utf-8")
-
-                        if content_query and content_query.lower() not in content.lower():
-                            continue
-
-                        date_str = ""
-                        date_match = re.search(r"(\d{4}-\d{2}-\d{2})", file_path.name)
-                        if date_match:
-                            date_str = date_match.group(1)
-
-                        relative_path = file_path.relative_to(notes_path)
-                        preview_lines = content.split("\n")[:5]
-                        preview = "\n".join(line for line in preview_lines if line.strip())
-
-                        results.append(
-                            {
-                                "customer": customer_dir.name,
-                                "file": str(relative_path),
-                                "full_path": str(file_path),
-                                "date": date_str,
-                                "preview": preview[:200] + "..." if len(preview) > 200 else preview,
-                            }
-                        )
-
-                    except Exception as e:
-                        logger.error(f"[CUSTOMER_NOTES_SEARCH] Error reading {file_path}: {e}")
-                        continue
-
-    logger.info(f"[CUSTOMER_NOTES_SEARCH] Found {len(results)} results")
+    logger.info("[CUSTOMER_NOTES_SEARCH] Found %d results", len(results))
 
     if not results:
         search_terms_display = []
@@ -127,23 +384,26 @@ def search_customer_notes(
         else:
             return "No customer meeting notes found in the directory."
 
-    if sort_by_date:
+    if needs_sort:
+        # Only the content-filtered path reaches here; the merge path above
+        # already produced date order
         results.sort(key=lambda x: x["date"], reverse=True)
 
     results = results[:limit]
 
-    output = [f"Found {len(results)} customer meeting note(s):\n"]
-
-    for idx, result in enumerate(results, 1):
-        output.append(f"\n{idx}. [{result['customer']}] {result['file']}")
-        if result["date"]:
-            output.append(f"   Date: {result['date']}")
-        output.append(f"   Preview: {result['preview']}")
-        output.append("")
-
-    output.append("\nTo read full content, use read_customer_note with the file path.")
+    # One block string per result, one final join - no growing intermediate
+    # list of line fragments
+    body = "\n".join(
+        f"\n{idx}. [{result['customer']}] {result['file']}"
+        + (f"\n   Date: {result['date']}" if result["date"] else "")
+        + f"\n   Preview: {result['preview']}\n"
+        for idx, result in enumerate(results, 1)
+    )
 
-    return "\n".join(output)
+    return (
+        f"Found {len(results)} customer meeting note(s):\n\n{body}\n"
+        "\nTo read full content, use read_customer_note with the file path."
+    )
 
 
 @tool
@@ -157,9 +417,9 @@ def read_customer_note(file_path: str) -> str:
     Returns:
         The full content of the note file
     """
-    notes_path = Path(config.CUSTOMER_NOTES_DIR)
+    notes_path, notes_exists, _ = _notes_root()
 
-    if not notes_path.exists():
+    if not notes_exists:
         return (
             f"Customer notes directory '{config.CUSTOMER_NOTES_DIR}' does not exist.\n\n"
             f"To set up customer notes:\n"
@@ -189,154 +449,277 @@ def read_customer_note(file_path: str) -> str:
 _doc_index = None
 _doc_search_tool = None
 
+# Set once the background build/load finishes and _doc_index is usable
+_index_ready = threading.Event()
+
+# Whether DocSearchIndex.search accepts a per-call rerank kwarg (detected at
+# build time; older llm-api-server versions only honor the config flag)
+_search_accepts_rerank = False
+
+
+def _build_index(rag_config) -> None:
+    """Build or load the RAG index; runs on a background daemon thread."""
+    global _doc_index, _search_accepts_rerank
+
+    try:
+        from llm_api_server.rag import DocSearchIndex
+
+        index = DocSearchIndex(rag_config)
+        _search_accepts_rerank = "rerank" in inspect.signature(index.search).parameters
+
+        if index.needs_update():
+            logger.info("Building RAG index (this may take several minutes)...")
+            index.crawl_and_index()
+            logger.info("RAG index built successfully")
+        else:
+            logger.info("Loading cached RAG index...")
+            index.load_index()
+            logger.info("RAG index loaded successfully")
+
+        _doc_index = index
+        _cached_search.cache_clear()  # drop results from any previous index
+        _index_ready.set()
+
+        # Throwaway query to pay the sentence-transformers cold start
+        # (tokenizer + graph build) here instead of on the first user turn.
+        # Still on the background thread; failure must not prevent serving.
+        try:
+            index.search("warmup", top_k=1)
+        except Exception as e:
+            logger.warning("RAG warmup query failed: %s", e)
+    except Exception:
+        logger.exception("Error initializing RAG")
+
+
+# Track doc search calls per session (resets after 5 min of inactivity).
+# Module level rather than a per-startup closure: no cell indirection on the
+# hot path, and the tool function is built once at import time.
+_doc_search_state = {"call_count": 0, "last_call": 0.0}
+_doc_state_lock = threading.Lock()
+_DOC_SEARCH_LIMIT = 2  # Allow 2 searches before forcing web_search
+_SESSION_TIMEOUT = 300  # 5 minutes - reset counter after this
+
+# Context budget for tool output: oversized retrieved chunks inflate the
+# downstream prompt (and time-to-first-token) without adding signal
+_MAX_CHARS_PER_RESULT = 1200
+_MAX_TOTAL_CHARS = 6000
+
+# Separator bar for the stop reminder, built once instead of per call
+_BAR60 = "=" * 60
+
+
+@lru_cache(maxsize=512)
+def _cached_search(query_norm: str, top_k: int, rerank: bool = False) -> tuple:
+    """Search the doc index, caching results per normalized (query, top_k).
+
+    Models retry the same or lightly-reworded queries within a session;
+    repeats skip the BM25 + vector search entirely. Returns a tuple so the
+    cached value is immutable. Cleared when the index is rebuilt.
+    """
+    if rerank and _search_accepts_rerank:
+        return tuple(_doc_index.search(query_norm, top_k=top_k, rerank=True))
+    return tuple(_doc_index.search(query_norm, top_k=top_k))
+
+
+def _dedupe_results(results: tuple, top_k: int) -> list:
+    """Drop near-duplicate passages, keeping at most top_k.
+
+    HashiCorp docs often surface the same paragraph under several headings,
+    and joining those verbatim wastes prompt budget. A cheap word-set
+    Jaccard test (>= 0.9 overlap) filters them. Lexical rather than
+    MMR-over-embeddings because the index doesn't expose result vectors;
+    near-identical text is the failure mode being targeted anyway.
+    """
+    kept: list = []
+    kept_words: list[set[str]] = []
+    for result in results:
+        words = set((result.get("text") or "").lower().split())
+        duplicate = False
+        for seen in kept_words:
+            union = len(words | seen)
+            if union and len(words & seen) / union >= 0.9:
+                duplicate = True
+                break
+        if not duplicate:
+            kept.append(result)
+            kept_words.append(words)
+            if len(kept) == top_k:
+                break
+    return kept
+
+
+@tool
+def hashicorp_doc_search(query: str, top_k: int = 5, rerank: bool = False) -> str:
+    """Search HashiCorp documentation for technical information about Terraform, Vault, Consul,
+    Nomad, Packer, Boundary, Waypoint, and other HashiCorp products. Returns relevant text
+    excerpts with source URLs. You can try up to 2 different searches, then use web_search.
+
+    Args:
+        query: The search query to find relevant documentation
+        top_k: Number of results to return (default 5)
+        rerank: Rerank results with a cross-encoder. Much slower (tens of
+            seconds); set True only when precision is critical
+
+    Returns:
+        Relevant documentation excerpts with source URLs
+    """
+    # Model-supplied arguments are untrusted: clamp top_k so a runaway value
+    # can't score the whole corpus into one giant blob, and bound the query
+    # so a prompt-injected mega-string can't blow up the embedding input
+    try:
+        top_k = max(1, min(int(top_k), 10))
+    except (TypeError, ValueError):
+        top_k = 5
+    query = (query or "").strip()[:512]
+    if not query:
+        return "Empty search query. Provide a few keywords describing what to look up."
+
+    # Early requests arrive while the index is still building; give it
+    # a beat, then steer the model to web_search rather than blocking
+    if not _index_ready.is_set():
+        _index_ready.wait(timeout=0.25)
+        if not _index_ready.is_set():
+            return (
+                "The documentation index is still loading in the background. "
+                "Use web_search to answer this question, or retry doc search shortly."
+            )
+
+    # Reset counter if session timed out (new conversation). monotonic() is
+    # immune to NTP/wall-clock jumps, and the lock keeps concurrent tool
+    # calls from losing increments on the read-modify-write.
+    with _doc_state_lock:
+        current_time = time.monotonic()
+        if current_time - _doc_search_state["last_call"] > _SESSION_TIMEOUT:
+            _doc_search_state["call_count"] = 0
+
+        _doc_search_state["call_count"] += 1
+        _doc_search_state["last_call"] = current_time
+        call_count = _doc_search_state["call_count"]
+
+    # Over-fetch, then drop near-duplicates down to top_k so every slot in
+    # the prompt carries distinct content
+    results = _dedupe_results(_cached_search(query.strip().lower(), top_k * 2, rerank), top_k)
+
+    if not results:
+        if call_count >= _DOC_SEARCH_LIMIT:
+            return (
+                "No relevant documentation found.\n\n"
+                "⚠️ STOP: You've searched documentation twice with no good results. "
+                "Use web_search NOW to find the answer."
+            )
+        return (
+            "No relevant documentation found for this query.\n"
+            f"You have {_DOC_SEARCH_LIMIT - call_count} doc search(es) remaining before you must use web_search."
+        )
+
+    # Build the reminder first, then format results into a preallocated list
+    # (no append-resizing) and join once
+    if call_count >= _DOC_SEARCH_LIMIT:
+        reminder = (
+            f"\n\n{_BAR60}\n"
+            "⚠️ STOP: This is your 2nd doc search. If these results don't answer "
+            "the question, you MUST use web_search now. No more doc searches allowed.\n"
+            f"{_BAR60}"
+        )
+    else:
+        remaining = _DOC_SEARCH_LIMIT - call_count
+        reminder = (
+            f"\n\n[Doc search {call_count}/{_DOC_SEARCH_LIMIT}. "
+            f"If not helpful, you can try {remaining} more, then must use web_search.]"
+        )
+
+    # search() returns list of dicts with keys: text, url, heading_path, metadata, score
+    output_parts = [None] * len(results)
+    for i, result in enumerate(results):
+        source = result.get("url", "Unknown source")
+        content = (result.get("text") or "")[:_MAX_CHARS_PER_RESULT]
+        heading = result.get("heading_path", "")
+        if heading:
+            output_parts[i] = f"[{i + 1}] Source: {source}\nSection: {heading}\n{content}"
+        else:
+            output_parts[i] = f"[{i + 1}] Source: {source}\n{content}"
+
+    # Enforce the total budget by dropping trailing results (never the first)
+    total_chars = 0
+    for n, part in enumerate(output_parts):
+        total_chars += len(part)
+        if n and total_chars > _MAX_TOTAL_CHARS:
+            output_parts = output_parts[:n]
+            break
+
+    return "\n\n---\n\n".join(output_parts) + reminder
+
 
 def initialize_rag_at_startup() -> None:
-    """Initialize RAG index at startup if enabled.
+    """Initialize RAG search at startup if enabled.
 
-    This ensures the index is built before the first request,
-    avoiding delays for the first user. Creates a doc_search tool
-    that the model can use to search HashiCorp documentation.
+    Creates the doc_search tool immediately and kicks off the index
+    build/load on a background thread, so server bring-up isn't blocked
+    for the minutes a crawl can take. Until the index is ready the tool
+    tells the model to fall back to web_search.
     """
     if not config.RAG_ENABLED:
-        print("RAG disabled (set RAG_ENABLED=true to enable)")
+        logger.info("RAG disabled (set RAG_ENABLED=true to enable)")
         return
 
     try:
-        from llm_api_server.rag import DocSearchIndex, RAGConfig
+        from llm_api_server.rag import RAGConfig
 
-        global _doc_index, _doc_search_tool
+        global _doc_search_tool
 
         # Validate that RAG sources are configured
         if not config.RAG_DOC_SOURCES or not config.RAG_DOC_SOURCES[0]:
-            print("\nWarning: RAG_ENABLED=true but RAG_DOC_SOURCES not configured")
-            print("  Set RAG_DOC_SOURCES in .env (comma-separated URLs)")
+            logger.warning("RAG_ENABLED=true but RAG_DOC_SOURCES not configured; set RAG_DOC_SOURCES in .env (comma-separated URLs)")
             return
 
-        print("")
-        print("=" * 60)
-        print("⏳ PLEASE WAIT: Loading indexes may take several minutes")
-        print("=" * 60)
-        print("")
-        print("Initializing HashiCorp documentation search index...")
-        print(f"  Sources: {', '.join(config.RAG_DOC_SOURCES)}")
+        logger.info("Initializing HashiCorp documentation search index in the background...")
+        logger.info("Sources: %s", ", ".join(config.RAG_DOC_SOURCES))
 
         # Combine any extra doc sources with explicit manual URLs
         manual_urls = list(config.RAG_MANUAL_URLS)
         if len(config.RAG_DOC_SOURCES) > 1:
             manual_urls.extend(config.RAG_DOC_SOURCES[1:])
 
-        rag_config = RAGConfig(
-            base_url=config.RAG_DOC_SOURCES[0],
-            cache_dir=config.RAG_CACHE_DIR,
-            manual_urls=manual_urls,
-            manual_urls_only=False,
-            max_crawl_depth=config.RAG_MAX_CRAWL_DEPTH,
-            rate_limit_delay=config.RAG_RATE_LIMIT_DELAY,
-            max_workers=config.RAG_MAX_WORKERS,
-            max_pages=config.RAG_MAX_PAGES,
-            url_include_patterns=config.RAG_URL_INCLUDE_PATTERNS,
-            url_exclude_patterns=config.RAG_URL_EXCLUDE_PATTERNS,
-            hybrid_bm25_weight=config.RAG_BM25_WEIGHT,
-            hybrid_semantic_weight=config.RAG_SEMANTIC_WEIGHT,
-            search_top_k=config.RAG_TOP_K,
-            rerank_enabled=config.RAG_RERANK_ENABLED,
-            update_check_interval_hours=config.RAG_UPDATE_INTERVAL_HOURS,
-        )
-
-        _doc_index = DocSearchIndex(rag_config)
-
-        if _doc_index.needs_update():
-            print("Building RAG index (this may take several minutes)...")
-            _doc_index.crawl_and_index()
-            print("✓ RAG index built successfully")
-        else:
-            print("Loading cached RAG index...")
-            _doc_index.load_index()
-            print("✓ RAG index loaded successfully")
-
-        # Track doc search calls per session (resets after 5 min of inactivity)
-        import time as _time
-
-        _doc_search_state = {"call_count": 0, "last_call": 0}
-        _DOC_SEARCH_LIMIT = 2  # Allow 2 searches before forcing web_search
-        _SESSION_TIMEOUT = 300  # 5 minutes - reset counter after this
-
-        # Create a custom doc search tool with fallback reminder after 2nd search
-        @tool
-        def hashicorp_doc_search(query: str, top_k: int = 5) -> str:
-            """Search HashiCorp documentation for technical information about Terraform, Vault, Consul,
-            Nomad, Packer, Boundary, Waypoint, and other HashiCorp products. Returns relevant text
-            excerpts with source URLs. You can try up to 2 different searches, then use web_search.
-
-            Args:
-                query: The search query to find relevant documentation
-                top_k: Number of results to return (default 5)
-
-            Returns:
-                Relevant documentation excerpts with source URLs
-            """
-            nonlocal _doc_search_state
-
-            # Reset counter if session timed out (new conversation)
-            current_time = _time.time()
-            if current_time - _doc_search_state["last_call"] > _SESSION_TIMEOUT:
-                _doc_search_state["call_count"] = 0
-
-            _doc_search_state["call_count"] += 1
-            _doc_search_state["last_call"] = current_time
-            call_count = _doc_search_state["call_count"]
-
-            results = _doc_index.search(query, top_k=top_k)
-
-            if not results:
-                if call_count >= _DOC_SEARCH_LIMIT:
-                    return (
-                        "No relevant documentation found.\n\n"
-                        "⚠️ STOP: You've searched documentation twice with no good results. "
-                        "Use web_search NOW to find the answer."
-                    )
-                return (
-                    "No relevant documentation found for this query.\n"
-                    f"You have {_DOC_SEARCH_LIMIT - call_count} doc search(es) remaining before you must use web_search."
-                )
-
-            # Format results - search() returns list of dicts with keys: text, url, heading_path, metadata, score
-            output_parts = []
-            for i, result in enumerate(results, 1):
-                source = result.get("url", "Unknown source")
-                content = result.get("text", "")
-                heading = result.get("heading_path", "")
-                if heading:
-                    output_parts.append(f"[{i}] Source: {source}\nSection: {heading}\n{content}")
-                else:
-                    output_parts.append(f"[{i}] Source: {source}\n{content}")
-
-            formatted_results = "\n\n---\n\n".join(output_parts)
-
-            # Add reminder based on call count
-            if call_count >= _DOC_SEARCH_LIMIT:
-                reminder = (
-                    "\n\n" + "=" * 60 + "\n"
-                    "⚠️ STOP: This is your 2nd doc search. If these results don't answer "
-                    "the question, you MUST use web_search now. No more doc searches allowed.\n"
-                    + "=" * 60
-                )
+        rag_kwargs = {
+            "base_url": config.RAG_DOC_SOURCES[0],
+            "cache_dir": config.RAG_CACHE_DIR,
+            "manual_urls": manual_urls,
+            "manual_urls_only": False,
+            "max_crawl_depth": config.RAG_MAX_CRAWL_DEPTH,
+            "rate_limit_delay": config.RAG_RATE_LIMIT_DELAY,
+            "max_workers": config.RAG_MAX_WORKERS,
+            "max_pages": config.RAG_MAX_PAGES,
+            "url_include_patterns": config.RAG_URL_INCLUDE_PATTERNS,
+            "url_exclude_patterns": config.RAG_URL_EXCLUDE_PATTERNS,
+            "hybrid_bm25_weight": config.RAG_BM25_WEIGHT,
+            "hybrid_semantic_weight": config.RAG_SEMANTIC_WEIGHT,
+            "search_top_k": config.RAG_TOP_K,
+            "rerank_enabled": config.RAG_RERANK_ENABLED,
+            "update_check_interval_hours": config.RAG_UPDATE_INTERVAL_HOURS,
+        }
+
+        # With semantic weight zeroed, run BM25-only and - when the installed
+        # llm-api-server supports it - skip loading the embedding model
+        if config.RAG_SEMANTIC_WEIGHT == 0.0:
+            rag_kwargs["hybrid_bm25_weight"] = 1.0
+            if "semantic_enabled" in inspect.signature(RAGConfig).parameters:
+                rag_kwargs["semantic_enabled"] = False
+                logger.info("BM25-only mode: skipping embedding model load")
             else:
-                remaining = _DOC_SEARCH_LIMIT - call_count
-                reminder = (
-                    f"\n\n[Doc search {call_count}/{_DOC_SEARCH_LIMIT}. "
-                    f"If not helpful, you can try {remaining} more, then must use web_search.]"
-                )
+                logger.info("BM25-only weights configured (RAG_SEMANTIC_WEIGHT=0)")
 
-            return formatted_results + reminder
+        rag_config = RAGConfig(**rag_kwargs)
+
+        # Build/load off the critical path: the server starts serving while
+        # the crawl or cached load runs
+        threading.Thread(target=_build_index, args=(rag_config,), daemon=True, name="rag-index-build").start()
 
         _doc_search_tool = hashicorp_doc_search
 
     except ImportError as e:
-        print(f"\nWarning: RAG dependencies not available: {e}")
-        print("  Install with: uv sync")
-    except Exception as e:
-        print(f"\nError initializing RAG: {e}")
+        logger.warning("RAG dependencies not available: %s (install with: uv sync)", e)
+    except Exception:
+        logger.exception("Error initializing RAG")
 
 
 # =============================================================================
@@ -346,6 +729,55 @@ def initialize_rag_at_startup() -> None:
 # Create web search tool (requires config for API key)
 web_search = create_web_search_tool(config)
 
+# Short-lived cache in front of web search: models routinely retry the
+# identical query within a tool loop, and every retry is a full network
+# round trip. Doc search already caches via _cached_search; the TTL here
+# keeps web results reasonably fresh while absorbing in-session repeats.
+_WEB_SEARCH_TTL = 300  # seconds; matches the doc-search session window
+_WEB_SEARCH_MAX = 128
+_web_search_cache: dict = {}
+_web_search_lock = threading.Lock()
+
+# The upstream tool reports failures as strings rather than raising, so
+# results whose head looks like an error/empty outcome are never cached -
+# pinning a transient network failure for the TTL would replay it on every
+# retry. Erring toward not caching is safe: a false positive just costs one
+# extra search.
+_WEB_ERROR_MARKERS = ("error", "failed", "unable to", "rate limit", "timed out", "no results")
+
+
+def _web_result_cacheable(result) -> bool:
+    if not isinstance(result, str) or not result.strip():
+        return False
+    head = result[:160].lower()
+    return not any(marker in head for marker in _WEB_ERROR_MARKERS)
+
+if callable(getattr(web_search, "func", None)):
+    _web_search_impl = web_search.func
+
+    def _cached_web_search(*args, **kwargs):
+        try:
+            cache_key = (args, tuple(sorted(kwargs.items())))
+            hash(cache_key)
+        except TypeError:
+            return _web_search_impl(*args, **kwargs)
+
+        now = time.monotonic()
+        with _web_search_lock:
+            hit = _web_search_cache.get(cache_key)
+            if hit is not None and now - hit[0] < _WEB_SEARCH_TTL:
+                return hit[1]
+
+        result = _web_search_impl(*args, **kwargs)
+        if _web_result_cacheable(result):
+            with _web_search_lock:
+                if len(_web_search_cache) >= _WEB_SEARCH_MAX:
+                    _web_search_cache.clear()  # coarse but O(1); a refill is cheap
+                _web_search_cache[cache_key] = (now, result)
+        return result
+
+    web_search.func = _cached_web_search
+
 # Ivan-specific tools
 IVAN_TOOLS = [
     search_customer_notes,
@@ -353,6 +785,12 @@ IVAN_TOOLS = [
 ]
 
 
+# get_all_tools cache: membership only changes when _doc_search_tool is
+# registered, so rebuilds are keyed on its identity
+_tools_cache: list | None = None
+_tools_cache_doc_tool = None
+
+
 def get_all_tools():
     """Get all available tools, including dynamically initialized ones.
 
@@ -361,7 +799,15 @@ def get_all_tools():
     - Ivan-specific tools (customer notes)
     - Config-dependent tools (web_search)
     - Dynamically initialized tools (hashicorp_doc_search)
+
+    The assembled list is cached and only rebuilt when the doc search tool
+    is (re)registered, so per-request callers get an O(1) lookup.
     """
+    global _tools_cache, _tools_cache_doc_tool
+
+    if _tools_cache is not None and _tools_cache_doc_tool is _doc_search_tool:
+        return _tools_cache
+
     tools = list(BUILTIN_TOOLS)  # Start with builtin tools from llm-api-server
     tools.extend(IVAN_TOOLS)  # Add Ivan-specific tools
     tools.append(web_search)  # Add web search (requires config)
@@ -370,6 +816,8 @@ def get_all_tools():
     if _doc_search_tool is not None:
         tools.append(_doc_search_tool)
 
+    _tools_cache = tools
+    _tools_cache_doc_tool = _doc_search_tool
     return tools
 
 